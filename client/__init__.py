@@ -7,12 +7,15 @@ It supports both direct client usage and LangChain integration.
 
 from .models import ChatResponse
 from .core import AIWrapper, quick_chat
-from .adapters import ChatAIWrapper, encode_file
+from .async_core import AsyncAIWrapper
+from .adapters import ChatAIWrapper, encode_file, encode_files
 
 __all__ = [
     "AIWrapper",
+    "AsyncAIWrapper",
     "ChatAIWrapper",
     "ChatResponse",
     "quick_chat",
     "encode_file",
+    "encode_files",
 ]
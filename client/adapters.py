@@ -1,8 +1,32 @@
-import base64
+import mmap
+import os
+import stat
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Optional, List, Any, Union
 from pathlib import Path
 from .core import AIWrapper
 
+# SIMD-accelerated base64 if available, stdlib otherwise (same API)
+try:
+    import pybase64
+
+    _HAS_PYBASE64 = True
+except ImportError:
+    import base64 as pybase64
+
+    _HAS_PYBASE64 = False
+
+_b64encode_as_string = getattr(pybase64, "b64encode_as_string", None)
+
+# Files at least this big are mmap'ed rather than read into memory
+_MMAP_MIN_BYTES = 1024 * 1024
+
+# Minimum total input for encode_files to go parallel. pybase64 releases the
+# GIL, so threads pay off early; stdlib base64 needs processes, whose startup
+# and result pickling only amortize over large inputs.
+_THREAD_MIN_BYTES = 4 * 1024 * 1024
+_PROCESS_MIN_BYTES = 64 * 1024 * 1024
+
 # Standard LangChain imports - handled gracefully if not installed
 try:
     from langchain_core.messages import BaseMessage, AIMessage, HumanMessage
@@ -24,6 +48,14 @@ except ImportError:
         pass
 
 
+def _b64_to_str(data: Any) -> str:
+    """Base64 encode any bytes-like object straight to an ASCII str."""
+    if _b64encode_as_string is not None:
+        # pybase64 can emit the final str directly, skipping the bytes copy
+        return _b64encode_as_string(data)
+    return pybase64.b64encode(data).decode("ascii")
+
+
 def encode_file(file_path: Union[str, Path]) -> str:
     """
     Helper to Base64 encode any file for sending to the AI Wrapper.
@@ -35,7 +67,57 @@ def encode_file(file_path: Union[str, Path]) -> str:
         str: Base64 formatted string.
     """
     with open(file_path, "rb") as f:
-        return base64.b64encode(f.read()).decode("utf-8")
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+            # Pipes, procfs and devices don't report a real size: read to EOF
+            return _b64_to_str(f.read())
+
+        if st.st_size >= _MMAP_MIN_BYTES:
+            # Map large files instead of copying them; the encoder reads pages directly
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _b64_to_str(mm)
+
+        # Read straight into an exact-size buffer (no growing reads), then
+        # trim if the file shrank and pick up anything appended since fstat
+        raw = bytearray(st.st_size)
+        n = f.readinto(raw)
+        del raw[n:]
+        raw += f.read()
+
+    return _b64_to_str(raw)
+
+
+def encode_files(
+    file_paths: List[Union[str, Path]], max_workers: Optional[int] = None
+) -> List[str]:
+    """
+    Base64 encode several files, in parallel when it pays off.
+
+    With pybase64 (which releases the GIL) files are spread over threads, so
+    results stay in-process. With stdlib base64 only large batches use worker
+    processes. Small batches, and single-core machines, are encoded serially.
+
+    Args:
+        file_paths: Paths (or strings) of the files to encode.
+        max_workers: Number of workers (defaults to the CPU count).
+
+    Returns:
+        List[str]: Base64 formatted strings, in the same order as `file_paths`.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if len(file_paths) <= 1 or workers <= 1:
+        return [encode_file(p) for p in file_paths]
+
+    total = sum(os.path.getsize(p) for p in file_paths)
+    if _HAS_PYBASE64:
+        executor, min_bytes = ThreadPoolExecutor, _THREAD_MIN_BYTES
+    else:
+        executor, min_bytes = ProcessPoolExecutor, _PROCESS_MIN_BYTES
+    if total < min_bytes:
+        return [encode_file(p) for p in file_paths]
+
+    with executor(max_workers=workers) as ex:
+        return list(ex.map(encode_file, file_paths))
 
 
 if _HAS_LANGCHAIN:
@@ -0,0 +1,144 @@
+import asyncio
+from typing import Optional, List, Dict, Any
+from .core import _build_chat_payload, _dumps, _loads
+from .models import ChatResponse
+
+# httpx is an optional dependency - handled gracefully if not installed
+try:
+    import httpx
+
+    _HAS_HTTPX = True
+except ImportError:
+    _HAS_HTTPX = False
+
+# HTTP/2 support in httpx needs the separate 'h2' package
+try:
+    import h2  # noqa: F401
+
+    _HAS_H2 = True
+except ImportError:
+    _HAS_H2 = False
+
+
+class AsyncAIWrapper:
+    """
+    Asyncio client for the AI Wrapper API.
+
+    Mirrors AIWrapper.chat but lets many prompts be in flight at once,
+    sharing one pooled (HTTP/2) connection.
+
+    Example:
+        >>> import asyncio
+        >>> from client import AsyncAIWrapper
+        >>> async def main():
+        ...     async with AsyncAIWrapper("http://localhost:8000") as client:
+        ...         return await client.chat_many(["Hi!", "Apa itu AI?"])
+        >>> responses = asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        timeout: int = 300,
+        http2: bool = True,
+    ):
+        """
+        Initialize the async AI Wrapper client.
+
+        Args:
+            base_url (str): The URL where the AI Wrapper API is running.
+            timeout (int): Request timeout in seconds.
+            http2 (bool): Multiplex concurrent requests over one HTTP/2 connection
+                (negotiated on https; falls back to HTTP/1.1 if 'h2' is missing).
+        """
+        if not _HAS_HTTPX:
+            raise ImportError(
+                "httpx is not installed. Please install 'httpx[http2]' to use AsyncAIWrapper."
+            )
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.http2 = http2 and _HAS_H2
+        self._client: Optional["httpx.AsyncClient"] = None
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Lazily create the pooled HTTP client inside the running event loop."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                http2=self.http2,
+                limits=httpx.Limits(max_keepalive_connections=32),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "AsyncAIWrapper":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def warmup(self) -> None:
+        """Pre-open a pooled connection to the API; errors are ignored."""
+        try:
+            await self._get_client().get("/status", timeout=5)
+        except httpx.HTTPError:
+            pass
+
+    async def chat(
+        self,
+        prompt: str,
+        project_url: Optional[str] = None,
+        files: Optional[List[str]] = None,
+        stop: Optional[List[str]] = None,
+    ) -> ChatResponse:
+        """
+        Send a chat message to the AI without blocking the event loop.
+
+        Args:
+            prompt (str): The text message to send.
+            project_url (Optional[str]): Explicit project URL if not using the server's default.
+            files (Optional[List[str]]): List of base64-encoded strings representing files.
+            stop (Optional[List[str]]): List of strings that should stop the generation (truncated on client side).
+
+        Returns:
+            ChatResponse: Standardized response object containing text or error details.
+        """
+        payload = _build_chat_payload(prompt, project_url, files)
+
+        try:
+            response = await self._get_client().post(
+                "/chat",
+                content=_dumps(payload),
+                headers={"Content-Type": "application/json"},
+            )
+            response.raise_for_status()
+            return ChatResponse.from_api(_loads(response.content), stop=stop)
+        except Exception as e:
+            return ChatResponse(status="error", error=str(e))
+
+    async def chat_many(
+        self, prompts: List[str], **kwargs: Any
+    ) -> List[ChatResponse]:
+        """
+        Send several independent prompts concurrently.
+
+        Args:
+            prompts (List[str]): The text messages to send.
+            **kwargs: Additional arguments passed to chat (e.g., project_url, stop).
+
+        Returns:
+            List[ChatResponse]: Responses in the same order as `prompts`.
+        """
+        return list(await asyncio.gather(*(self.chat(p, **kwargs) for p in prompts)))
+
+    async def get_status(self) -> Dict[str, Any]:
+        """Fetch server status and browser engine health."""
+        response = await self._get_client().get("/status", timeout=5)
+        response.raise_for_status()
+        return _loads(response.content)
@@ -1,7 +1,200 @@
+import copy
+import dataclasses
+import datetime
+import email.utils
+import gzip
+import hashlib
+import json
+import mimetypes
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
 import requests
-from typing import Optional, List, Dict, Any
+from requests.adapters import HTTPAdapter
+from typing import Optional, List, Dict, Any, Tuple, Union, Iterator
+from urllib3.exceptions import ConnectTimeoutError
 from .models import ChatResponse
 
+# orjson serializes straight to bytes and parses 2-5x faster; stdlib otherwise
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
+# Bodies smaller than this are not worth the gzip round-trip
+_COMPRESS_MIN_BYTES = 1024
+
+# Statuses worth retrying. A 502/504 from a proxy can come after the upstream
+# already received the request, so the prompt may be with the AI: only
+# idempotent requests retry on those. 503 means it was turned away unprocessed.
+_RETRY_STATUSES = frozenset({503})
+_RETRY_STATUSES_IDEMPOTENT = frozenset({502, 503, 504})
+
+# Longest wait between attempts, whether from backoff or Retry-After
+_MAX_RETRY_DELAY = 30.0
+
+# Circuit breaker: consecutive failed attempts before opening, seconds to stay open
+_BREAKER_THRESHOLD = 5
+_BREAKER_COOLDOWN = 10.0
+
+# Connect timeout for chat requests, separate from the (long) read timeout
+_CONNECT_TIMEOUT = 10
+
+
+def _never_sent(exc: requests.ConnectionError) -> bool:
+    """Tell whether a connection error happened before the request was sent."""
+    if isinstance(exc, requests.exceptions.ConnectTimeout):
+        return True
+    # requests wraps urllib3's MaxRetryError, whose `reason` is the real cause;
+    # NewConnectionError is a ConnectTimeoutError subclass
+    cause = exc.args[0] if exc.args else None
+    cause = getattr(cause, "reason", cause)
+    return isinstance(cause, ConnectTimeoutError)
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    """Seconds to wait per the response's Retry-After header, if it has one."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=datetime.timezone.utc)
+    return max(0.0, (when - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
+def _build_chat_payload(
+    prompt: str, project_url: Optional[str] = None, files: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Build a `/chat` JSON payload containing only the populated fields."""
+    payload: Dict[str, Any] = {"prompt": prompt}
+    if project_url is not None:
+        payload["project_url"] = project_url
+    if files:
+        payload["files"] = files
+    return payload
+
+
+def _copy_response(response: ChatResponse) -> ChatResponse:
+    """Copy a ChatResponse deeply enough that callers can't mutate the cache."""
+    return dataclasses.replace(response, candidates=copy.deepcopy(response.candidates))
+
+
+_FILENAME_ESCAPES = str.maketrans({'"': "%22", "\r": "%0D", "\n": "%0A"})
+
+
+class _MultipartBody:
+    """
+    Sized, iterable `multipart/form-data` body that streams files from disk.
+
+    requests sends it with a Content-Length and pulls chunks as it writes to
+    the socket, so peak memory stays O(chunk_size) regardless of file sizes.
+    Each file is sent at exactly the size recorded here, so the body always
+    matches Content-Length even if a file changes while uploading.
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, str],
+        paths: List[Path],
+        file_field: str = "files",
+        chunk_size: int = 64 * 1024,
+    ):
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self.chunk_size = chunk_size
+        self._parts: List[Union[bytes, Tuple[Path, int]]] = []
+
+        for name, value in fields.items():
+            self._parts.append(
+                f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'.encode()
+                + value.encode()
+                + b"\r\n"
+            )
+        for path in paths:
+            # Percent-encode like browsers/urllib3 so the name can't break headers
+            filename = path.name.translate(_FILENAME_ESCAPES)
+            mime = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+            self._parts.append(
+                f"--{boundary}\r\n"
+                f'Content-Disposition: form-data; name="{file_field}"; filename="{filename}"\r\n'
+                f"Content-Type: {mime}\r\n\r\n".encode()
+            )
+            self._parts.append((path, path.stat().st_size))
+            self._parts.append(b"\r\n")
+        self._parts.append(f"--{boundary}--\r\n".encode())
+
+        self._length = sum(len(p) if isinstance(p, bytes) else p[1] for p in self._parts)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[bytes]:
+        for part in self._parts:
+            if isinstance(part, bytes):
+                yield part
+                continue
+            path, remaining = part
+            with open(path, "rb") as f:
+                while remaining:
+                    chunk = f.read(min(self.chunk_size, remaining))
+                    if not chunk:
+                        raise OSError(
+                            f"{path} shrank while uploading ({remaining} bytes missing)"
+                        )
+                    remaining -= len(chunk)
+                    yield chunk
+
+
+class _TTLCache:
+    """Small thread-safe LRU cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[bytes, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: bytes, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
 
 class AIWrapper:
     """
@@ -14,18 +207,236 @@ class AIWrapper:
         >>> client = AIWrapper(base_url="http://localhost:8000")
         >>> response = client.chat("Hello!")
         >>> print(response.text)
+
+    The client keeps a persistent HTTP session, so it can also be used as a
+    context manager to release pooled connections when done:
+
+        >>> with AIWrapper() as client:
+        ...     client.chat("Hello!")
     """
 
-    def __init__(self, base_url: str = "http://localhost:8000", timeout: int = 300):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        timeout: int = 300,
+        cache_ttl: Optional[float] = None,
+        cache_size: int = 256,
+        dedupe_files: bool = False,
+        compress: bool = False,
+        verify: bool = False,
+        warmup: bool = False,
+        max_attempts: int = 3,
+    ):
         """
         Initialize the AI Wrapper client.
 
         Args:
             base_url (str): The URL where the AI Wrapper API is running.
             timeout (int): Request timeout in seconds.
+            cache_ttl (Optional[float]): Seconds to reuse successful chat responses
+                for identical requests. Disabled when None (the default), since a
+                repeated prompt is normally a new turn in the project conversation.
+            cache_size (int): Maximum number of cached chat responses.
+            dedupe_files (bool): Send files as content-addressed `file_refs` and only
+                upload the base64 data the first time a file is seen. Requires a
+                server that understands `file_refs`.
+            compress (bool): Gzip large JSON request bodies (`Content-Encoding: gzip`).
+                Requires a server that decompresses request bodies.
+            verify (bool): Check that the server is reachable before returning.
+                Off by default so construction does no network I/O.
+            warmup (bool): Open a pooled connection in a background thread so the
+                first real request skips the TCP/TLS handshake.
+            max_attempts (int): Attempts per request, with jittered exponential
+                backoff between them. POSTs are only retried when the request never
+                reached the server (connect failures) or on 503.
+
+        Raises:
+            ConnectionError: If `verify` is True and the server cannot be reached.
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self._url_chat = f"{self.base_url}/chat"
+        self._url_chat_batch = f"{self.base_url}/chat_batch"
+        self._url_status = f"{self.base_url}/status"
+        self._url_projects = f"{self.base_url}/projects"
+        self._url_reload = f"{self.base_url}/reload"
+        self._cache = _TTLCache(cache_size, cache_ttl) if cache_ttl else None
+        self.dedupe_files = dedupe_files
+        self._uploaded_files: set = set()
+        self.compress = compress
+
+        # Circuit breaker: after repeated failures, fail fast for a cooldown
+        # instead of piling more requests onto a struggling server.
+        self.max_attempts = max(1, max_attempts)
+        self._consecutive_failures = 0
+        self._open_until = 0.0
+        # The client is shared across threads (thread pools, quick_chat)
+        self._breaker_lock = threading.Lock()
+
+        # One pooled session for all calls so keep-alive reuses the socket
+        # (and TLS handshake) instead of reconnecting on every request.
+        # Retries are done by _send only, so the adapter itself never retries.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        if verify:
+            # The check itself leaves a warm connection in the pool
+            self._verify_connection()
+        elif warmup:
+            threading.Thread(target=self.warmup, daemon=True).start()
+
+    def warmup(self) -> None:
+        """Pre-open a keep-alive connection to the API; errors are ignored."""
+        try:
+            self._session.get(self._url_status, timeout=5).close()
+        except requests.RequestException:
+            pass
+
+    def _verify_connection(self) -> None:
+        """Hit `/status` once, raising ConnectionError if the API is unreachable."""
+        try:
+            self.get_status()
+        except (requests.RequestException, ValueError) as e:
+            # ValueError: /status answered with something that isn't JSON
+            raise ConnectionError(
+                f"Cannot reach AI Wrapper API at {self.base_url}: {e}"
+            ) from e
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "AIWrapper":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def clear_cache(self) -> None:
+        """Drop all cached chat responses."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    @staticmethod
+    def _cache_key(
+        prompt: str,
+        project_url: Optional[str],
+        files: Optional[List[str]],
+        stop: Optional[List[str]],
+    ) -> bytes:
+        """Hash the request fields into a compact cache key."""
+        h = hashlib.blake2b(digest_size=16)
+        for field in (prompt, project_url or "", *(files or ()), "\x00", *(stop or ())):
+            h.update(field.encode())
+            h.update(b"\x00")
+        return h.digest()
+
+    def _send(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Issue a request with retry, jittered backoff and circuit breaking.
+
+        GETs are retried on any connection error and 502/503/504. Other methods
+        (chat POSTs are not idempotent) are only retried when the request never
+        left the client, or on 503, so a prompt is never delivered twice. A
+        Retry-After header on a retried response overrides the backoff delay.
+        When retries run out or the circuit opens, the last real error is
+        raised (or the last response returned).
+        """
+        if self._circuit_open():
+            raise ConnectionError(
+                f"Circuit open: {self.base_url} failed {self._consecutive_failures} "
+                "times in a row, not sending requests for now"
+            )
+
+        idempotent = method.upper() in ("GET", "HEAD")
+        retry_statuses = _RETRY_STATUSES_IDEMPOTENT if idempotent else _RETRY_STATUSES
+        attempt = 0
+        while True:
+            attempt += 1
+            delay = min(_MAX_RETRY_DELAY, 0.25 * 2 ** (attempt - 1))
+            delay *= random.uniform(0.5, 1.5)
+            try:
+                response = self._session.request(method, url, **kwargs)
+            except requests.ConnectionError as e:
+                self._record_failure()
+                if not (idempotent or _never_sent(e)) or self._give_up(attempt):
+                    raise
+            except requests.RequestException:
+                # Read timeouts and the like count against the server but are
+                # never retried: the AI may already be working on the prompt
+                self._record_failure()
+                raise
+            else:
+                # Every 5xx counts as a failure, retried or not
+                if response.status_code >= 500:
+                    self._record_failure()
+                else:
+                    self._record_success()
+                retryable = response.status_code in retry_statuses
+                if not retryable or self._give_up(attempt):
+                    return response
+                retry_after = _retry_after(response)
+                if retry_after is not None:
+                    delay = min(_MAX_RETRY_DELAY, retry_after)
+            time.sleep(delay)
+
+    def _give_up(self, attempt: int) -> bool:
+        """Stop retrying once attempts are exhausted or the circuit has opened."""
+        return attempt >= self.max_attempts or self._circuit_open()
+
+    def _circuit_open(self) -> bool:
+        """Whether the breaker is currently short-circuiting requests."""
+        with self._breaker_lock:
+            return time.monotonic() < self._open_until
+
+    def _record_failure(self) -> None:
+        """Count a failed attempt and open the circuit past the threshold."""
+        with self._breaker_lock:
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= _BREAKER_THRESHOLD:
+                self._open_until = time.monotonic() + _BREAKER_COOLDOWN
+
+    def _record_success(self) -> None:
+        """Reset the failure count after a non-5xx response."""
+        with self._breaker_lock:
+            self._consecutive_failures = 0
+
+    def _post_json(self, url: str, payload: Dict[str, Any]) -> requests.Response:
+        """POST a JSON payload, gzip-compressing the body when enabled."""
+        body = _dumps(payload)
+        headers = {"Content-Type": "application/json"}
+        if self.compress and len(body) >= _COMPRESS_MIN_BYTES:
+            # Level 1 is by far the fastest and still shrinks base64 well
+            body = gzip.compress(body, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
+        return self._send(
+            "POST",
+            url,
+            data=body,
+            headers=headers,
+            timeout=(_CONNECT_TIMEOUT, self.timeout),
+        )
+
+    def _file_refs(
+        self, files: List[str], full: bool = False
+    ) -> Tuple[List[Dict[str, str]], List[str]]:
+        """
+        Build content-addressed references for base64 files.
+
+        Files already uploaded through this client are sent as `{"sha": ...}`
+        only; new ones (or all, when `full`) also carry their `data`.
+        """
+        refs, hashes = [], []
+        for b64 in files:
+            sha = hashlib.sha256(b64.encode()).hexdigest()
+            hashes.append(sha)
+            if full or sha not in self._uploaded_files:
+                refs.append({"sha": sha, "data": b64})
+            else:
+                refs.append({"sha": sha})
+        return refs, hashes
 
     def chat(
         self,
@@ -33,6 +444,7 @@ class AIWrapper:
         project_url: Optional[str] = None,
         files: Optional[List[str]] = None,
         stop: Optional[List[str]] = None,
+        use_cache: bool = True,
     ) -> ChatResponse:
         """
         Send a chat message to the AI, optionally with multimedia files and stop sequences.
@@ -42,66 +454,176 @@ class AIWrapper:
             project_url (Optional[str]): Explicit project URL if not using the server's default.
             files (Optional[List[str]]): List of base64-encoded strings representing files.
             stop (Optional[List[str]]): List of strings that should stop the generation (truncated on client side).
+            use_cache (bool): Serve/store this request from the response cache, if enabled.
 
         Returns:
             ChatResponse: Standardized response object containing text or error details.
         """
-        payload = {"prompt": prompt, "project_url": project_url, "files": files}
+        key = None
+        if use_cache and self._cache is not None:
+            key = self._cache_key(prompt, project_url, files, stop)
+            cached = self._cache.get(key)
+            if cached is not None:
+                return _copy_response(cached)
+
+        hashes: List[str] = []
+        if files and self.dedupe_files:
+            payload = _build_chat_payload(prompt, project_url)
+            payload["file_refs"], hashes = self._file_refs(files)
+        else:
+            payload = _build_chat_payload(prompt, project_url, files)
 
         try:
-            response = requests.post(
-                f"{self.base_url}/chat", json=payload, timeout=self.timeout
-            )
+            response = self._post_json(self._url_chat, payload)
+            response.raise_for_status()
+            data = _loads(response.content)
+
+            if hashes and data.get("status") == "missing_file":
+                # Server no longer has a referenced file: resend all in full
+                self._uploaded_files.difference_update(hashes)
+                payload["file_refs"], _ = self._file_refs(files, full=True)
+                response = self._post_json(self._url_chat, payload)
+                response.raise_for_status()
+                data = _loads(response.content)
+
+            result = ChatResponse.from_api(data, stop=stop)
+        except Exception as e:
+            return ChatResponse(status="error", error=str(e))
+
+        if hashes and result.success:
+            self._uploaded_files.update(hashes)
+
+        if key is not None and result.success:
+            self._cache.set(key, _copy_response(result))
+        return result
+
+    def chat_batch(
+        self,
+        prompts: List[str],
+        project_url: Optional[str] = None,
+        stop: Optional[List[str]] = None,
+    ) -> List[ChatResponse]:
+        """
+        Send several prompts in a single HTTP call to the `/chat_batch` endpoint.
+
+        Saves one round-trip per prompt compared to calling `chat` in a loop and
+        lets the server process the prompts in parallel.
+
+        Args:
+            prompts (List[str]): The text messages to send.
+            project_url (Optional[str]): Explicit project URL if not using the server's default.
+            stop (Optional[List[str]]): List of strings that should stop the generation (truncated on client side).
+
+        Returns:
+            List[ChatResponse]: Responses in the same order as `prompts`. If the
+                request fails or the server does not return one result per prompt,
+                every entry carries the same error.
+        """
+        payload: Dict[str, Any] = {"prompts": prompts}
+        if project_url is not None:
+            payload["project_url"] = project_url
+
+        try:
+            response = self._post_json(self._url_chat_batch, payload)
             response.raise_for_status()
-            data = response.json()
-
-            res_text = data.get("response")
-            candidates = data.get("candidates")
-
-            # Client-side truncation for stop sequences
-            if stop and res_text:
-                for s in stop:
-                    if s in res_text:
-                        res_text = res_text.split(s)[0]
-
-                # Also truncate candidates accordingly
-                if candidates:
-                    for cand in candidates:
-                        parts = cand.get("content", {}).get("parts", [])
-                        for part in parts:
-                            if "text" in part:
-                                for s in stop:
-                                    if s in part["text"]:
-                                        part["text"] = part["text"].split(s)[0]
-
-            return ChatResponse(
-                status=data.get("status", "error"),
-                project_id=data.get("project_id"),
-                response=res_text,
-                candidates=candidates,
-                error=data.get("error"),
-                files_uploaded=data.get("files_uploaded"),
+            data = _loads(response.content)
+        except Exception as e:
+            return [ChatResponse(status="error", error=str(e)) for _ in prompts]
+
+        # Never hand back a list that doesn't line up with `prompts`
+        if isinstance(data, dict):
+            error = data.get("error") or (
+                f"Unexpected batch response (status: {data.get('status')})"
+            )
+        elif not isinstance(data, list):
+            error = f"Unexpected batch response of type {type(data).__name__}"
+        elif len(data) != len(prompts):
+            error = f"Expected {len(prompts)} batch results, got {len(data)}"
+        else:
+            return [
+                ChatResponse.from_api(item, stop=stop)
+                if isinstance(item, dict)
+                else ChatResponse(status="error", error="Malformed batch result")
+                for item in data
+            ]
+        return [ChatResponse(status="error", error=error) for _ in prompts]
+
+    def chat_upload(
+        self,
+        prompt: str,
+        file_paths: List[Union[str, Path]],
+        project_url: Optional[str] = None,
+        stop: Optional[List[str]] = None,
+    ) -> ChatResponse:
+        """
+        Send a chat message with files uploaded as raw `multipart/form-data`.
+
+        Unlike `chat(files=...)`, the file bytes are not base64-encoded or wrapped
+        in JSON, so the request body is ~25% smaller and no encoding work is done.
+        Requires a server whose `/chat` endpoint accepts multipart uploads.
+
+        Args:
+            prompt (str): The text message to send.
+            file_paths (List[Union[str, Path]]): Paths of the files to upload.
+            project_url (Optional[str]): Explicit project URL if not using the server's default.
+            stop (Optional[List[str]]): List of strings that should stop the generation (truncated on client side).
+
+        Returns:
+            ChatResponse: Standardized response object containing text or error details.
+        """
+        data = {"prompt": prompt}
+        if project_url is not None:
+            data["project_url"] = project_url
+
+        try:
+            # Files are streamed from disk in chunks rather than loaded whole
+            body = _MultipartBody(data, [Path(p) for p in file_paths])
+            response = self._send(
+                "POST",
+                self._url_chat,
+                data=body,
+                headers={"Content-Type": body.content_type},
+                timeout=(_CONNECT_TIMEOUT, self.timeout),
             )
+            response.raise_for_status()
+            return ChatResponse.from_api(_loads(response.content), stop=stop)
         except Exception as e:
             return ChatResponse(status="error", error=str(e))
 
     def get_status(self) -> Dict[str, Any]:
         """Fetch server status and browser engine health."""
-        response = requests.get(f"{self.base_url}/status", timeout=5)
+        response = self._send("GET", self._url_status, timeout=5)
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
 
     def list_projects(self) -> Dict[str, Any]:
         """List currently active AI project contexts in the server."""
-        response = requests.get(f"{self.base_url}/projects", timeout=5)
+        response = self._send("GET", self._url_projects, timeout=5)
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
 
     def reload_engine(self) -> Dict[str, str]:
         """Trigger a reload of the browser engine if needed."""
-        response = requests.post(f"{self.base_url}/reload", timeout=30)
+        response = self._send("POST", self._url_reload, timeout=30)
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
+
+
+# Shared clients for quick_chat, one per base URL, so repeated calls reuse
+# the same pooled connection instead of reconnecting every time.
+_CLIENT_CACHE: Dict[str, AIWrapper] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _get_shared_client(base_url: str) -> AIWrapper:
+    """Return the module-level AIWrapper for `base_url`, creating it once."""
+    client = _CLIENT_CACHE.get(base_url)
+    if client is None:
+        with _CLIENT_CACHE_LOCK:
+            client = _CLIENT_CACHE.get(base_url)
+            if client is None:
+                client = _CLIENT_CACHE[base_url] = AIWrapper(base_url)
+    return client
 
 
 def quick_chat(prompt: str, base_url: str = "http://localhost:8000", **kwargs) -> str:
@@ -116,5 +638,4 @@ def quick_chat(prompt: str, base_url: str = "http://localhost:8000", **kwargs) -
     Returns:
         str: The AI's response text.
     """
-    client = AIWrapper(base_url)
-    return client.chat(prompt, **kwargs).text
+    return _get_shared_client(base_url).chat(prompt, **kwargs).text
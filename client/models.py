@@ -1,8 +1,12 @@
+import sys
 from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 
+# slots=True (no per-instance __dict__) is only available on Python 3.10+
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ChatResponse:
     """
     Standardized response from the AI Wrapper API.
@@ -23,6 +27,48 @@ class ChatResponse:
     error: Optional[str] = None
     files_uploaded: Optional[int] = None
 
+    @classmethod
+    def from_api(
+        cls, data: Dict[str, Any], stop: Optional[List[str]] = None
+    ) -> "ChatResponse":
+        """
+        Build a ChatResponse from a raw `/chat` JSON payload.
+
+        Args:
+            data (Dict[str, Any]): Decoded JSON body returned by the API.
+            stop (Optional[List[str]]): Stop sequences to truncate on client side.
+
+        Returns:
+            ChatResponse: The parsed (and possibly truncated) response.
+        """
+        res_text = data.get("response")
+        candidates = data.get("candidates")
+
+        # Client-side truncation for stop sequences
+        if stop and res_text:
+            for s in stop:
+                if s in res_text:
+                    res_text = res_text.split(s)[0]
+
+            # Also truncate candidates accordingly
+            if candidates:
+                for cand in candidates:
+                    parts = cand.get("content", {}).get("parts", [])
+                    for part in parts:
+                        if "text" in part:
+                            for s in stop:
+                                if s in part["text"]:
+                                    part["text"] = part["text"].split(s)[0]
+
+        return cls(
+            status=data.get("status", "error"),
+            project_id=data.get("project_id"),
+            response=res_text,
+            candidates=candidates,
+            error=data.get("error"),
+            files_uploaded=data.get("files_uploaded"),
+        )
+
     @property
     def success(self) -> bool:
         """Check if the request was successful."""
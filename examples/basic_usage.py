@@ -4,7 +4,10 @@ Basic Usage Examples - AI Wrapper Client
 Contoh dasar menggunakan AI Wrapper API dengan struktur modular baru.
 """
 
-from client import AIWrapper, ChatAIWrapper, encode_file
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from client import AIWrapper, AsyncAIWrapper, ChatAIWrapper, encode_file
 
 # ============================================================================
 # SETUP: Ganti dengan URL VM Anda
@@ -108,6 +111,41 @@ def example_monitoring():
         print(f"✗ Error monitoring: {e}")
 
 
+# ============================================================================
+# Example 5: Batch Processing (Concurrent)
+# ============================================================================
+def example_batch_processing():
+    """Mengirim banyak pertanyaan sekaligus secara concurrent (asyncio / thread)."""
+    print("\n" + "=" * 70)
+    print("Example 5: Batch Processing")
+    print("=" * 70)
+
+    questions = [
+        "Apa itu machine learning?",
+        "Apa itu deep learning?",
+        "Apa itu neural network?",
+    ]
+
+    async def run_batch():
+        # Semua prompt dikirim bersamaan lewat satu koneksi
+        async with AsyncAIWrapper(API_URL) as client:
+            return await client.chat_many(questions)
+
+    try:
+        responses = asyncio.run(run_batch())
+    except ImportError:
+        # Tanpa httpx: pakai thread pool, semua thread berbagi koneksi AIWrapper
+        with AIWrapper(API_URL) as client:
+            with ThreadPoolExecutor(max_workers=8) as ex:
+                responses = list(ex.map(client.chat, questions))
+
+    for question, response in zip(questions, responses):
+        if response.success:
+            print(f"✓ {question}\n  → {response.text}")
+        else:
+            print(f"✗ {question}\n  → Error: {response.error}")
+
+
 # ============================================================================
 # Main
 # ============================================================================
@@ -121,6 +159,7 @@ if __name__ == "__main__":
     example_multimedia_chat()
     example_langchain_integration()
     example_monitoring()
+    example_batch_processing()
 
     print("\n" + "=" * 70)
     print("DONE")